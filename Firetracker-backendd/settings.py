@@ -4,6 +4,8 @@ Django settings for Firetracker project.
 Generated by 'django-admin startproject' using Django 5.1.
 """
 
+import importlib.util
+import logging
 import os
 from pathlib import Path
 import platform
@@ -48,6 +50,20 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Development-only query profiling: nplusone logs lazy loads triggered by the admin
+# list_display callables, django-debug-toolbar shows the SQL issued per request.
+# Both are optional and only enabled when installed locally.
+if DEBUG and importlib.util.find_spec('nplusone'):
+    INSTALLED_APPS.append('nplusone.ext.django')
+    MIDDLEWARE.insert(0, 'nplusone.ext.django.NPlusOneMiddleware')
+    NPLUSONE_LOGGER = logging.getLogger('nplusone')
+    NPLUSONE_LOG_LEVEL = logging.WARN
+
+if DEBUG and importlib.util.find_spec('debug_toolbar'):
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.insert(0, 'debug_toolbar.middleware.DebugToolbarMiddleware')
+    INTERNAL_IPS = ['127.0.0.1']
+
 ROOT_URLCONF = 'Firetracker-backendd.urls'
 
 TEMPLATES = [
@@ -179,6 +195,10 @@ CACHES = {
 
 # API settings
 API_VERSION = '1.0.0'
+
+# Rows per INSERT when bulk-loading fire points. FirePoint has 9 columns, so the
+# default stays well under PostgreSQL's 65535 bind-parameter limit per statement.
+FIREPOINT_BULK_BATCH_SIZE = int(os.getenv('FIREPOINT_BULK_BATCH_SIZE', '5000'))
 WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
 
 # Leaflet configuration
@@ -216,4 +236,11 @@ LOGGING = {
         'handlers': ['console'],
         'level': 'INFO' if DEBUG else 'WARNING',
     },
+    'loggers': {
+        'nplusone': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
 }
\ No newline at end of file
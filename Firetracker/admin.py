@@ -3,73 +3,89 @@ from django.contrib.gis import admin as gis_admin
 from django.urls import path
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import CharField, Func, Value
+from django.db.models.functions import Substr
 from django import forms
 from django.utils import timezone
 from django.conf import settings
 from .models import Province, District, FirePoint, GeoDataUpload
 from .forms import GeoDataUploadForm
+from .paginators import ApproxCountPaginator, CachingPaginator
+from .tasks import enqueue_upload
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
-class ProvinceAdmin(gis_admin.GISModelAdmin):
-    list_display = ('admin1Name', 'admin1Pcod', 'created_at', 'updated_at')
+TIMESTAMP_SQL_FORMAT = 'YYYY-MM-DD HH24:MI'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M'
+
+class TimestampAdminMixin:
+    """Shows created_at/updated_at formatted by the database instead of per row in Python"""
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if connections[queryset.db].vendor != 'postgresql':
+            return queryset
+        return queryset.annotate(
+            _created_str=Func('created_at', Value(TIMESTAMP_SQL_FORMAT), function='to_char', output_field=CharField()),
+            _updated_str=Func('updated_at', Value(TIMESTAMP_SQL_FORMAT), function='to_char', output_field=CharField()),
+        )
+
+    def _format_timestamp(self, obj, field):
+        formatted = getattr(obj, f'_{field}_str', None)
+        if formatted is None:
+            value = getattr(obj, field)
+            formatted = value.strftime(TIMESTAMP_FORMAT) if value else None
+        return formatted or 'N/A'
+
+    # Not named after the model fields: admin lookups resolve a field before a ModelAdmin method
+    def created_at_display(self, obj):
+        return self._format_timestamp(obj, 'created_at')
+    created_at_display.short_description = 'Created At'
+    created_at_display.admin_order_field = 'created_at'
+
+    def updated_at_display(self, obj):
+        return self._format_timestamp(obj, 'updated_at')
+    updated_at_display.short_description = 'Updated At'
+    updated_at_display.admin_order_field = 'updated_at'
+
+class ProvinceAdmin(TimestampAdminMixin, gis_admin.GISModelAdmin):
+    list_display = ('admin1Name', 'admin1Pcod', 'created_at_display', 'updated_at_display')
     search_fields = ('admin1Name', 'admin1Pcod')
     list_filter = ('created_at', 'updated_at')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at_display', 'updated_at_display')
     ordering = ('admin1Name',)
+    paginator = CachingPaginator
+    show_full_result_count = False
 
-    def created_at(self, obj):
-        return obj.created_at.strftime('%Y-%m-%d %H:%M') if obj.created_at else 'N/A'
-    created_at.short_description = 'Created At'
-
-    def updated_at(self, obj):
-        return obj.updated_at.strftime('%Y-%m-%d %H:%M') if obj.updated_at else 'N/A'
-    updated_at.short_description = 'Updated At'
-
-class DistrictAdmin(gis_admin.GISModelAdmin):
-    list_display = ('admin2Name', 'admin2Pcod', 'admin1Name', 'created_at', 'updated_at')
+class DistrictAdmin(TimestampAdminMixin, gis_admin.GISModelAdmin):
+    list_display = ('admin2Name', 'admin2Pcod', 'admin1Name', 'created_at_display', 'updated_at_display')
     search_fields = ('admin2Name', 'admin1Name')
     list_filter = ('admin1Name', 'created_at')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at_display', 'updated_at_display')
     ordering = ('admin1Name', 'admin2Name')
+    paginator = CachingPaginator
+    show_full_result_count = False
 
-    def created_at(self, obj):
-        return obj.created_at.strftime('%Y-%m-%d %H:%M') if obj.created_at else 'N/A'
-    created_at.short_description = 'Created At'
-
-    def updated_at(self, obj):
-        return obj.updated_at.strftime('%Y-%m-%d %H:%M') if obj.updated_at else 'N/A'
-    updated_at.short_description = 'Updated At'
-
-class FirePointAdmin(gis_admin.GISModelAdmin):
-    list_display = ('acq_date', 'latitude', 'longitude', 'confidence', 'frp', 'created_at')
+class FirePointAdmin(TimestampAdminMixin, gis_admin.GISModelAdmin):
+    list_display = ('acq_date', 'latitude', 'longitude', 'confidence', 'frp', 'created_at_display')
     list_filter = ('acq_date', 'confidence', 'created_at')
     date_hierarchy = 'acq_date'
     search_fields = ('latitude', 'longitude')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at_display', 'updated_at_display')
     ordering = ('-acq_date',)
     actions = ['delete_selected_bulk']
-
-    def created_at(self, obj):
-        return obj.created_at.strftime('%Y-%m-%d %H:%M') if obj.created_at else 'N/A'
-    created_at.short_description = 'Created At'
-
-    def updated_at(self, obj):
-        return obj.updated_at.strftime('%Y-%m-%d %H:%M') if obj.updated_at else 'N/A'
-    updated_at.short_description = 'Updated At'
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
 
     @admin.action(description='Delete selected firepoints (bulk)')
     def delete_selected_bulk(self, request, queryset):
         try:
             with transaction.atomic():
-                count = queryset.count()
-                batch_size = 1000
-                for i in range(0, count, batch_size):
-                    batch = queryset[i:i+batch_size]
-                    batch._raw_delete(batch.db)
+                # One DELETE for the whole selection; its rowcount doubles as the report
+                count = queryset._raw_delete(queryset.db)
                 self.message_user(
                     request,
                     f'Successfully deleted {count} firepoints',
@@ -92,16 +108,24 @@ class GeoDataUploadAdminForm(forms.ModelForm):
             }),
         }
 
-class GeoDataUploadAdmin(admin.ModelAdmin):
+class GeoDataUploadAdmin(TimestampAdminMixin, admin.ModelAdmin):
     form = GeoDataUploadAdminForm
     list_display = ('title', 'data_type', 'upload_format', 'processed', 'records_processed', 'processing_status', 'processing_errors_short')
-    readonly_fields = ('processing_errors_display', 'created_at', 'updated_at', 'processing_time', 'processing_status')
+    readonly_fields = ('processing_errors_display', 'created_at_display', 'updated_at_display', 'processing_time', 'processing_status', 'queued_at')
     list_filter = ('data_type', 'upload_format', 'processed', 'created_at')
     actions = ['process_selected', 'retry_failed_uploads']
     date_hierarchy = 'created_at'
+    paginator = CachingPaginator
+    show_full_result_count = False
     
+    def get_queryset(self, request):
+        # Truncate the error text in SQL so the changelist never pulls the full column
+        return super().get_queryset(request).defer('processing_errors').annotate(
+            _processing_errors_short=Substr('processing_errors', 1, 100)
+        )
+
     def processing_errors_short(self, obj):
-        return obj.processing_errors[:100] + "..." if obj.processing_errors else ""
+        return obj._processing_errors_short + "..." if obj._processing_errors_short else ""
     processing_errors_short.short_description = 'Errors'
     
     def processing_errors_display(self, obj):
@@ -111,6 +135,11 @@ class GeoDataUploadAdmin(admin.ModelAdmin):
     def processing_status(self, obj):
         if obj.processed:
             return "✅ Completed"
+        if obj.queued_at:
+            # A queue entry lost to a restart stays here - re-run it with "Process selected"
+            return f"🕒 Queued since {obj.queued_at.strftime(TIMESTAMP_FORMAT)}"
+        if obj._processing_errors_short:
+            return "❌ Failed"
         return "⏳ Pending"
     processing_status.short_description = 'Status'
 
@@ -120,14 +149,6 @@ class GeoDataUploadAdmin(admin.ModelAdmin):
         return "N/A"
     processing_time.short_description = 'Processing Time'
 
-    def created_at(self, obj):
-        return obj.created_at.strftime('%Y-%m-%d %H:%M') if obj.created_at else 'N/A'
-    created_at.short_description = 'Created At'
-
-    def updated_at(self, obj):
-        return obj.updated_at.strftime('%Y-%m-%d %H:%M') if obj.updated_at else 'N/A'
-    updated_at.short_description = 'Updated At'
-
     def get_urls(self):
         urls = super().get_urls()
         custom_urls = [
@@ -143,7 +164,11 @@ class GeoDataUploadAdmin(admin.ModelAdmin):
                 try:
                     with transaction.atomic():
                         upload.save()  # Save first to get ID
-                        if upload.process():
+                        if upload.upload_format == 'shp':
+                            # Shapefiles take a while to parse and load - don't hold the request
+                            enqueue_upload(upload)
+                            messages.info(request, f'{upload.title} was queued for processing')
+                        elif upload.process():
                             messages.success(
                                 request,
                                 f'Successfully processed {upload.records_processed} records from {upload.title}'
@@ -168,10 +193,17 @@ class GeoDataUploadAdmin(admin.ModelAdmin):
     @admin.action(description='Process selected uploads')
     def process_selected(self, request, queryset):
         success_count = 0
+        queued_count = 0
         failure_count = 0
         
-        for upload in queryset:
+        # Stream rows in chunks; the error text is only needed once process() rewrites it
+        for upload in queryset.defer('processing_errors').iterator(chunk_size=100):
             try:
+                if upload.upload_format == 'shp':
+                    enqueue_upload(upload)
+                    queued_count += 1
+                    self.message_user(request, f'Queued {upload.title} for processing', messages.INFO)
+                    continue
                 logger.info(f"Processing upload {upload.id} - {upload.title}")
                 if upload.process():
                     success_count += 1
@@ -197,8 +229,8 @@ class GeoDataUploadAdmin(admin.ModelAdmin):
         
         self.message_user(
             request,
-            f'Processing complete. Success: {success_count}, Failures: {failure_count}',
-            messages.SUCCESS if success_count > 0 else messages.ERROR
+            f'Processing complete. Success: {success_count}, Queued: {queued_count}, Failures: {failure_count}',
+            messages.SUCCESS if success_count or queued_count else messages.ERROR
         )
 
     @admin.action(description='Retry failed uploads')
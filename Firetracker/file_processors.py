@@ -1,23 +1,46 @@
 
+import os
+import shutil
 import pandas as pd
-import json
+import orjson
 import logging
-from django.contrib.gis.geos import Point, Polygon, MultiPolygon, GEOSGeometry
+from operator import methodcaller
+from django.contrib.gis.geos import Point, GEOSGeometry
 from django.contrib.gis.gdal import DataSource
 from django.core.files.storage import default_storage
-from .models import Province, District, FirePoint
+from django.conf import settings
+from django.db import connection, transaction
+from .models import Province, District, FirePoint, _nullable, copy_firepoints
 
 logger = logging.getLogger(__name__)
 
+# Explicit types for the coordinate columns so pandas skips type inference on them.
+# Optional columns are coerced separately since they may hold blanks or text.
+FIREPOINT_DTYPES = {'latitude': 'float64', 'longitude': 'float64'}
+
+# Property names used by the different boundary datasets, in order of preference
+PROVINCE_NAME_KEYS = ('admin1Name', 'ADM1_EN', 'NAME_1')
+PROVINCE_PCODE_KEYS = ('admin1Pcod', 'ADM1_PCODE', 'PCODE_1')
+DISTRICT_NAME_KEYS = ('admin2Name', 'ADM2_EN', 'NAME_2')
+DISTRICT_PCODE_KEYS = ('admin2Pcod', 'ADM2_PCODE', 'PCODE_2')
+POLYGON_TYPES = frozenset(('Polygon', 'MultiPolygon'))
+
+def _property_getter(sample_props, candidates):
+    """Pick the property name a dataset uses once, from a sample feature"""
+    for key in candidates:
+        if sample_props.get(key):
+            return methodcaller('get', key)
+    return methodcaller('get', candidates[0])
+
 def process_firepoint_file(uploaded_file):
     """Process firepoint data from CSV or Excel files"""
     try:
         # Handle both in-memory and on-disk files
         if hasattr(uploaded_file, 'temporary_file_path'):
             filepath = uploaded_file.temporary_file_path()
-            df = pd.read_csv(filepath) if filepath.endswith('.csv') else pd.read_excel(filepath)
+            df = pd.read_csv(filepath, dtype=FIREPOINT_DTYPES) if filepath.endswith('.csv') else pd.read_excel(filepath, dtype=FIREPOINT_DTYPES)
         else:
-            df = pd.read_csv(uploaded_file) if uploaded_file.name.endswith('.csv') else pd.read_excel(uploaded_file)
+            df = pd.read_csv(uploaded_file, dtype=FIREPOINT_DTYPES) if uploaded_file.name.endswith('.csv') else pd.read_excel(uploaded_file, dtype=FIREPOINT_DTYPES)
         
         # Validate required columns
         required_columns = {'latitude', 'longitude', 'brightness', 'acq_date'}
@@ -25,45 +48,79 @@ def process_firepoint_file(uploaded_file):
             missing = required_columns - set(df.columns)
             raise ValueError(f"Missing required columns: {missing}")
 
-        # Process each row
-        for _, row in df.iterrows():
-            FirePoint.objects.create(
-                latitude=float(row['latitude']),
-                longitude=float(row['longitude']),
-                brightness=float(row.get('brightness', 0)),
-                acq_date=row['acq_date'],
-                frp=float(row.get('frp', 0)),
-                confidence=int(row.get('confidence', 0)),
-                geometry=Point(float(row['longitude']), float(row['latitude']))
-            )
+        # Coerce whole columns at once; missing or unparseable brightness/frp default to 0
+        for column in ('brightness', 'frp', 'confidence'):
+            values = df[column] if column in df.columns else 0
+            df[column] = pd.to_numeric(values, errors='coerce')
+        df[['brightness', 'frp']] = df[['brightness', 'frp']].fillna(0)
+        # Confidence outside the 0-100 range the database constraint enforces is stored as NULL
+        confidence = df['confidence']
+        df['confidence'] = confidence.where(confidence.between(0, 100) & (confidence % 1 == 0)).astype('Int64')
+        df['acq_date'] = pd.to_datetime(df['acq_date'])
+
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                copy_firepoints(df)
+            else:
+                _bulk_create_firepoints(df)
         return True
     except Exception as e:
         logger.error(f"Error processing firepoints: {str(e)}", exc_info=True)
         raise  # Re-raise for handling in the view
 
+def _bulk_create_firepoints(df):
+    """Insert cleaned firepoint rows through the ORM for non-PostgreSQL backends"""
+    firepoints = [
+        FirePoint(
+            latitude=lat,
+            longitude=lon,
+            brightness=b,
+            acq_date=d,
+            frp=f,
+            confidence=c,
+            geometry=Point(lon, lat, srid=4326)
+        )
+        for lat, lon, b, d, f, c in zip(
+            df['latitude'].tolist(), df['longitude'].tolist(), df['brightness'].tolist(),
+            df['acq_date'].dt.to_pydatetime(), df['frp'].tolist(), _nullable(df['confidence'])
+        )
+    ]
+    FirePoint.objects.bulk_create(firepoints, batch_size=settings.FIREPOINT_BULK_BATCH_SIZE)
+
 def process_province_file(uploaded_file):
     """Process province data from GeoJSON files"""
     try:
-        content = uploaded_file.read().decode('utf-8')
-        data = json.loads(content)
+        # orjson parses the raw bytes, so no decoded copy of the payload is made
+        data = orjson.loads(uploaded_file.read())
         
-        for feature in data['features']:
+        features = data['features']
+        first_props = features[0]['properties'] if features else {}
+        get_admin1Name = _property_getter(first_props, PROVINCE_NAME_KEYS)
+        get_admin1Pcod = _property_getter(first_props, PROVINCE_PCODE_KEYS)
+        
+        # Validate every feature in Python first, then write them all in one transaction
+        provinces = []
+        for feature in features:
             props = feature['properties']
-            admin1Name = props.get('admin1Name') or props.get('ADM1_EN') or props.get('NAME_1')
-            admin1Pcod = props.get('admin1Pcod') or props.get('ADM1_PCODE') or props.get('PCODE_1')
+            admin1Name = get_admin1Name(props)
+            admin1Pcod = get_admin1Pcod(props)
             
             if not admin1Name:
                 raise ValueError("Could not determine province name from properties")
             
-            geometry = GEOSGeometry(json.dumps(feature['geometry']))
-            if not isinstance(geometry, (Polygon, MultiPolygon)):
+            # Reject other geometry types before paying for the GEOS parse
+            if feature['geometry']['type'] not in POLYGON_TYPES:
                 raise ValueError("Province geometry must be Polygon or MultiPolygon")
+            geometry = GEOSGeometry(orjson.dumps(feature['geometry']))
             
-            Province.objects.create(
+            provinces.append(Province(
                 admin1Name=admin1Name,
                 admin1Pcod=admin1Pcod,
                 geometry=geometry
-            )
+            ))
+        
+        with transaction.atomic():
+            Province.objects.bulk_create(provinces, batch_size=500)
         return True
     except Exception as e:
         logger.error(f"Error processing provinces: {str(e)}", exc_info=True)
@@ -86,55 +143,77 @@ def process_district_file(uploaded_file, auxiliary_files=None):
 
 def _process_district_geojson(uploaded_file):
     """Helper for GeoJSON district processing"""
-    content = uploaded_file.read().decode('utf-8')
-    data = json.loads(content)
+    # orjson parses the raw bytes, so no decoded copy of the payload is made
+    data = orjson.loads(uploaded_file.read())
+    
+    features = data['features']
+    first_props = features[0]['properties'] if features else {}
+    get_admin2Name = _property_getter(first_props, DISTRICT_NAME_KEYS)
+    get_admin2Pcod = _property_getter(first_props, DISTRICT_PCODE_KEYS)
+    get_admin1Name = _property_getter(first_props, PROVINCE_NAME_KEYS)
     
-    for feature in data['features']:
+    # Validate every feature in Python first, then write them all in one transaction
+    districts = []
+    for feature in features:
         props = feature['properties']
-        admin2Name = props.get('admin2Name') or props.get('ADM2_EN') or props.get('NAME_2')
-        admin2Pcod = props.get('admin2Pcod') or props.get('ADM2_PCODE') or props.get('PCODE_2')
-        admin1Name = props.get('admin1Name') or props.get('ADM1_EN') or props.get('NAME_1')
+        admin2Name = get_admin2Name(props)
+        admin2Pcod = get_admin2Pcod(props)
+        admin1Name = get_admin1Name(props)
         
-        geometry = GEOSGeometry(json.dumps(feature['geometry']))
-        if not isinstance(geometry, (Polygon, MultiPolygon)):
+        # Reject other geometry types before paying for the GEOS parse
+        if feature['geometry']['type'] not in POLYGON_TYPES:
             raise ValueError("District geometry must be Polygon or MultiPolygon")
+        geometry = GEOSGeometry(orjson.dumps(feature['geometry']))
         
-        District.objects.create(
+        districts.append(District(
             admin2Name=admin2Name,
             admin2Pcod=admin2Pcod,
             admin1Name=admin1Name,
             geometry=geometry
-        )
+        ))
+    
+    with transaction.atomic():
+        District.objects.bulk_create(districts, batch_size=500)
     return True
 
+def _save_upload(uploaded_file, path):
+    """Write an uploaded file to path, hard-linking uploads that are already on disk"""
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        try:
+            os.link(uploaded_file.temporary_file_path(), path)
+            return
+        except OSError:
+            pass  # e.g. different filesystems - fall back to copying
+    uploaded_file.seek(0)
+    with open(path, 'wb') as destination:
+        shutil.copyfileobj(uploaded_file, destination, length=1 << 20)
+
 def _process_district_shapefile(shp_file, auxiliary_files):
     """Helper for Shapefile district processing"""
     # Create temporary directory for shapefile components
     import tempfile
-    import os
     
     with tempfile.TemporaryDirectory() as temp_dir:
         # Save all shapefile components
         shp_path = os.path.join(temp_dir, shp_file.name)
-        with open(shp_path, 'wb+') as destination:
-            for chunk in shp_file.chunks():
-                destination.write(chunk)
+        _save_upload(shp_file, shp_path)
         
         for aux_file in auxiliary_files:
-            aux_path = os.path.join(temp_dir, aux_file.name)
-            with open(aux_path, 'wb+') as destination:
-                for chunk in aux_file.chunks():
-                    destination.write(chunk)
+            _save_upload(aux_file, os.path.join(temp_dir, aux_file.name))
         
         # Process the shapefile
         ds = DataSource(shp_path)
         layer = ds[0]
         
-        for feature in layer:
-            District.objects.create(
+        districts = [
+            District(
                 admin2Name=feature.get('admin2Name'),
                 admin2Pcod=feature.get('admin2Pcod'),
                 admin1Name=feature.get('admin1Name'),
                 geometry=feature.geom.geos
             )
+            for feature in layer
+        ]
+        with transaction.atomic():
+            District.objects.bulk_create(districts, batch_size=500)
     return True
\ No newline at end of file
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 import os
 
@@ -14,13 +15,19 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR('Missing admin credentials in environment variables'))
             return
             
-        if User.objects.filter(username=username).exists():
+        # get_or_create does a SELECT and only INSERTs when the user is missing; callable
+        # defaults are evaluated on create only, so the (slow) password hash is skipped otherwise
+        _, created = User.objects.get_or_create(
+            username=username,
+            defaults={
+                'email': email,
+                'password': lambda: make_password(password),
+                'is_staff': True,
+                'is_superuser': True,
+            }
+        )
+        if not created:
             self.stdout.write(self.style.WARNING('Admin user already exists'))
             return
             
-        User.objects.create_superuser(
-            username=username,
-            email=email,
-            password=password
-        )
         self.stdout.write(self.style.SUCCESS('Superuser created successfully'))
\ No newline at end of file
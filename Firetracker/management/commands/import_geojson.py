@@ -1,11 +1,26 @@
 import os
-import json
+import ijson
+import orjson
 from django.core.management.base import BaseCommand
-from django.contrib.gis.geos import GEOSGeometry
-from Firetracker.models import Province, District, FirePoint
+from django.db import connection, transaction
+from django.contrib.gis.geos import GEOSGeometry, Point
+from Firetracker.models import Province, District, FirePoint, _parse_confidence
 
 class Command(BaseCommand):
     help = 'Import GeoJSON data into the database'
+    batch_size = 2000
+
+    def clear_tables(self, *models):
+        """Empty the given tables without fetching rows or dispatching delete signals"""
+        if connection.vendor == 'postgresql':
+            tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model in models)
+            with connection.cursor() as cursor:
+                cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY CASCADE')
+        else:
+            # Children first so foreign keys never point at deleted rows
+            for model in models:
+                queryset = model.objects.all()
+                queryset._raw_delete(queryset.db)
     
     def handle(self, *args, **options):
         # Get the base directory (where manage.py is)
@@ -24,22 +39,26 @@ class Command(BaseCommand):
         
         # Clear existing data
         self.stdout.write("Clearing existing data...")
-        Province.objects.all().delete()
-        District.objects.all().delete()
-        FirePoint.objects.all().delete()
+        self.clear_tables(FirePoint, District, Province)
         
         # ===== IMPORT PROVINCES =====
         if os.path.exists(provinces_path):
             try:
-                with open(provinces_path) as f:
-                    data = json.load(f)
+                with open(provinces_path, 'rb') as f, transaction.atomic():
                     count = 0
-                    for feature in data['features']:
-                        Province.objects.create(
+                    batch = []
+                    # Stream one feature at a time instead of loading the whole collection
+                    for feature in ijson.items(f, 'features.item', use_float=True):
+                        batch.append(Province(
                             admin1Name=feature['properties']['admin1Name'],
                             admin1Pcod=feature['properties']['admin1Pcod'],
-                            geometry=GEOSGeometry(json.dumps(feature['geometry'])))
-                        count += 1
+                            geometry=GEOSGeometry(orjson.dumps(feature['geometry']))))
+                        if len(batch) >= self.batch_size:
+                            Province.objects.bulk_create(batch)
+                            count += len(batch)
+                            batch.clear()
+                    Province.objects.bulk_create(batch)
+                    count += len(batch)
                     self.stdout.write(self.style.SUCCESS(f"Successfully imported {count} provinces"))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"Error importing provinces: {str(e)}"))
@@ -49,16 +68,22 @@ class Command(BaseCommand):
         # ===== IMPORT DISTRICTS =====
         if os.path.exists(districts_path):
             try:
-                with open(districts_path) as f:
-                    data = json.load(f)
+                with open(districts_path, 'rb') as f, transaction.atomic():
                     count = 0
-                    for feature in data['features']:
-                        District.objects.create(
+                    batch = []
+                    # Stream one feature at a time instead of loading the whole collection
+                    for feature in ijson.items(f, 'features.item', use_float=True):
+                        batch.append(District(
                             admin2Name=feature['properties']['admin2Name'],
                             admin2Pcod=feature['properties']['admin2Pcod'],
                             admin1Name=feature['properties']['admin1Name'],
-                            geometry=GEOSGeometry(json.dumps(feature['geometry'])))
-                        count += 1
+                            geometry=GEOSGeometry(orjson.dumps(feature['geometry']))))
+                        if len(batch) >= self.batch_size:
+                            District.objects.bulk_create(batch)
+                            count += len(batch)
+                            batch.clear()
+                    District.objects.bulk_create(batch)
+                    count += len(batch)
                     self.stdout.write(self.style.SUCCESS(f"Successfully imported {count} districts"))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"Error importing districts: {str(e)}"))
@@ -68,19 +93,30 @@ class Command(BaseCommand):
         # ===== IMPORT FIREPOINTS =====
         if os.path.exists(firepoints_path):
             try:
-                with open(firepoints_path) as f:
-                    data = json.load(f)
+                with open(firepoints_path, 'rb') as f, transaction.atomic():
                     count = 0
-                    for feature in data['features']:
-                        FirePoint.objects.create(
-                            latitude=feature['properties']['latitude'],
-                            longitude=feature['properties']['longitude'],
-                            brightness=feature['properties']['brightness'],
-                            acq_date=feature['properties']['acq_date'],
-                            frp=feature['properties']['frp'],
-                            confidence=feature['properties']['confidence'],
-                            geometry=GEOSGeometry(json.dumps(feature['geometry'])))
-                        count += 1
+                    batch = []
+                    # Stream one feature at a time instead of loading the whole collection
+                    for feature in ijson.items(f, 'features.item', use_float=True):
+                        props = feature['properties']
+                        # Confidence outside the 0-100 range the database constraint enforces is stored as NULL
+                        confidence = _parse_confidence(props.get('confidence'))
+                        if confidence is not None and confidence > 100:
+                            confidence = None
+                        batch.append(FirePoint(
+                            latitude=props['latitude'],
+                            longitude=props['longitude'],
+                            brightness=props['brightness'],
+                            acq_date=props['acq_date'],
+                            frp=props['frp'],
+                            confidence=confidence,
+                            geometry=Point(props['longitude'], props['latitude'], srid=4326)))
+                        if len(batch) >= self.batch_size:
+                            FirePoint.objects.bulk_create(batch)
+                            count += len(batch)
+                            batch.clear()
+                    FirePoint.objects.bulk_create(batch)
+                    count += len(batch)
                     self.stdout.write(self.style.SUCCESS(f"Successfully imported {count} firepoints"))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"Error importing firepoints: {str(e)}"))
@@ -3,6 +3,24 @@ from django.db import migrations
 def clean_province_duplicates(apps, schema_editor):
     Province = apps.get_model('Firetracker', 'Province')
     
+    if schema_editor.connection.vendor == 'postgresql':
+        # Keep the lowest ID per admin1Pcod and delete the rest (cascading to their
+        # districts, as the ORM delete would) in one statement
+        District = apps.get_model('Firetracker', 'District')
+        quote = schema_editor.quote_name
+        table = quote(Province._meta.db_table)
+        pcod = quote(Province._meta.get_field('admin1Pcod').column)
+        district_table = quote(District._meta.db_table)
+        province_fk = quote(District._meta.get_field('province').column)
+        schema_editor.execute(
+            f"WITH dupes AS ("
+            f"SELECT id FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY {pcod} ORDER BY id) AS rn "
+            f"FROM {table}) ranked WHERE ranked.rn > 1), "
+            f"orphans AS (DELETE FROM {district_table} WHERE {province_fk} IN (SELECT id FROM dupes)) "
+            f"DELETE FROM {table} WHERE id IN (SELECT id FROM dupes)"
+        )
+        return
+    
     # Find all duplicate admin1Pcod values
     from django.db.models import Count, Min
     duplicates = (
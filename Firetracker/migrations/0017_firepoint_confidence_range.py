@@ -0,0 +1,30 @@
+# Generated by Django 5.1.1 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+def clear_out_of_range_confidence(apps, schema_editor):
+    # Rows loaded before confidence was validated would make AddConstraint fail
+    FirePoint = apps.get_model('Firetracker', 'FirePoint')
+    FirePoint.objects.filter(
+        models.Q(confidence__lt=0) | models.Q(confidence__gt=100)
+    ).update(confidence=None)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Firetracker', '0016_alter_district_geometry_alter_province_geometry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='firepoint',
+            name='confidence',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(clear_out_of_range_confidence, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='firepoint',
+            constraint=models.CheckConstraint(condition=models.Q(('confidence__gte', 0), ('confidence__lte', 100)), name='firepoint_conf_range'),
+        ),
+    ]
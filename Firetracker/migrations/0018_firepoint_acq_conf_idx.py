@@ -0,0 +1,21 @@
+# Generated by Django 5.1.1 on 2026-10-15 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Firetracker', '0017_firepoint_confidence_range'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='firepoint',
+            name='Firetracker_acq_dat_92f46f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='firepoint',
+            index=models.Index(fields=['-acq_date', 'confidence'], name='firepoint_acq_conf_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-15 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Firetracker', '0018_firepoint_acq_conf_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geodataupload',
+            name='queued_at',
+            field=models.DateTimeField(blank=True, help_text='Set while waiting for or undergoing background processing', null=True),
+        ),
+    ]
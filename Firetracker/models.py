@@ -1,28 +1,198 @@
 from django.contrib.gis.db import models
+from django.contrib.gis.db.models.functions import MakeValid
 from django.contrib.gis.geos import Point, Polygon, MultiPolygon, GEOSGeometry
 from django.db import models as django_models
-from django.db import transaction
+from django.db import connection, transaction
 from django.core.exceptions import ValidationError
+from django.conf import settings
+import io
 import logging
 import pandas as pd
 import zipfile
 import tempfile
 import os
-import json
+import re
+import shutil
+import struct
+import ijson
+import orjson
 import time
+from itertools import repeat
 from datetime import datetime
 from django.utils.timezone import make_aware
 
-# Configure logging
+try:
+    from pyogrio.raw import read as read_ogr
+except ImportError:  # shapefiles are then read through Django's GDAL bindings
+    read_ogr = None
+
+# Configure logging (the level comes from settings.LOGGING)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# FIRMS exports write acq_date as YYYY-MM-DD; parsing with an explicit format skips dateutil
+ACQ_DATE_FORMAT = '%Y-%m-%d'
+ACQ_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Scalar firepoint columns loaded by copy_firepoints(), in staging-table order
+FIREPOINT_COPY_COLUMNS = ('latitude', 'longitude', 'acq_date', 'brightness', 'frp', 'confidence')
+
+# Shapefile components needed to read a layer (geometry, index, attributes, projection, encoding)
+SHAPEFILE_EXTENSIONS = {'.shp', '.shx', '.dbf', '.prj', '.cpg'}
+
+VALID_UPLOAD_EXTENSIONS = ('.csv', '.json', '.geojson', '.zip')
 
 # Define the validator function first
 def validate_file_extension(value):
-    ext = os.path.splitext(value.name)[1].lower()
-    valid_extensions = ['.csv', '.json', '.geojson', '.zip']
-    if ext not in valid_extensions:
-        raise ValidationError(f'Unsupported file extension. Supported formats: {", ".join(valid_extensions)}')
+    if not value.name.lower().endswith(VALID_UPLOAD_EXTENSIONS):
+        raise ValidationError(f'Unsupported file extension. Supported formats: {", ".join(VALID_UPLOAD_EXTENSIONS)}')
+
+def _nullable(series):
+    """Convert a pandas Series to a list with missing values as None"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def _compile_aliases(aliases):
+    """Flatten {field: (alias, ...)} into {alias: (field, rank)} for _match_properties"""
+    return {
+        alias: (field, rank)
+        for field, candidates in aliases.items()
+        for rank, alias in enumerate(candidates)
+    }
+
+# Lowercase property spellings used by the boundary datasets, in order of preference
+PROVINCE_FIELD_ALIASES = _compile_aliases({
+    'pcod': ('adm1_pcode',),
+    'name': ('adm1_en',),
+})
+DISTRICT_FIELD_ALIASES = _compile_aliases({
+    'pcod': ('admin2pcod', 'adm2_pcode', 'pcode'),
+    'name': ('admin2name', 'adm2_en', 'name'),
+    'parent_pcod': ('admin1pcod', 'adm1_pcode'),
+    'parent_name': ('admin1name', 'adm1_en'),
+})
+
+def _match_properties(props, aliases):
+    """Case-insensitively pick several properties in a single pass over a feature's properties.
+
+    aliases is a table from _compile_aliases; empty values are ignored so a later
+    alias can still match.
+    """
+    matched = {}
+    ranks = {}
+    for prop, value in props.items():
+        hit = aliases.get(prop.lower())
+        if hit is None or not value:
+            continue
+        field, rank = hit
+        if rank < ranks.get(field, len(aliases)):
+            matched[field] = value
+            ranks[field] = rank
+    return matched
+
+def _make_valid_multipolygon(geometry):
+    """Repair an invalid (Multi)Polygon with GEOS MakeValid, keeping only its polygonal parts"""
+    geometry = geometry.make_valid()
+    if geometry.geom_type == 'MultiPolygon':
+        return geometry
+    if geometry.geom_type == 'Polygon':
+        return MultiPolygon([geometry], srid=geometry.srid)
+
+    # MakeValid can return a GeometryCollection mixing polygons with collapsed lines/points
+    polygons = []
+    for part in geometry:
+        if part.geom_type == 'Polygon':
+            polygons.append(part)
+        elif part.geom_type == 'MultiPolygon':
+            polygons.extend(part)
+    return MultiPolygon(polygons, srid=geometry.srid) if polygons else None
+
+def _repair_geometries(queryset):
+    """Fix the queryset's invalid geometries in one UPDATE, keeping only their polygon parts"""
+    polygons = models.Func(MakeValid('geometry'), models.Value(3), function='ST_CollectionExtract')
+    return queryset.filter(geometry__isvalid=False).update(
+        geometry=models.Func(polygons, function='ST_Multi', output_field=models.MultiPolygonField(srid=4326))
+    )
+
+def _promote_polygon_wkb(wkb):
+    """Prefix a Polygon's WKB with a one-part MultiPolygon header; other geometries pass through.
+
+    GEOS then parses each boundary once as a MultiPolygon instead of parsing a Polygon and
+    copying it into a new MultiPolygon.
+    """
+    order = '<' if wkb[0] == 1 else '>'
+    if struct.unpack_from(f'{order}I', wkb, 1)[0] != 3:
+        return wkb
+    return wkb[:1] + struct.pack(f'{order}II', 6, 1) + wkb
+
+def _first_value(values, positions):
+    """Return the first non-empty value at the given column positions"""
+    return next((values[position] for position in positions if values[position]), None)
+
+def _read_shapefile(shp_path):
+    """Return the field names of a shapefile's first layer and its (values, geometry) pairs.
+
+    values is a tuple in field_names order, so callers can resolve columns to positions once.
+
+    pyogrio reads every attribute and geometry in one call in C; without it the layer
+    is iterated feature by feature through Django's GDAL bindings.
+    """
+    if read_ogr is not None:
+        meta, _, geometries, field_data = read_ogr(shp_path)
+        field_names = list(meta['fields'])
+        rows = zip(*(values.tolist() for values in field_data)) if field_names else repeat(())
+        features = (
+            (values, GEOSGeometry(memoryview(_promote_polygon_wkb(wkb))) if wkb is not None else None)
+            for wkb, values in zip(geometries, rows)
+        )
+        return field_names, features
+
+    from django.contrib.gis.gdal import DataSource
+    layer = DataSource(shp_path)[0]
+    field_names = list(layer.fields)
+    features = (
+        (tuple(feature.get(name) for name in field_names), GEOSGeometry(memoryview(feature.geom.wkb)) if feature.geom else None)
+        for feature in layer
+    )
+    return field_names, features
+
+def copy_firepoints(df):
+    """COPY cleaned firepoint rows into a staging table and let PostGIS build the points.
+
+    df needs the FIREPOINT_COPY_COLUMNS; returns the number of rows inserted.
+    """
+    buffer = io.StringIO()
+    df[list(FIREPOINT_COPY_COLUMNS)].to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    qn = connection.ops.quote_name
+    table = qn(FirePoint._meta.db_table)
+    columns = ', '.join(qn(FirePoint._meta.get_field(name).column) for name in FIREPOINT_COPY_COLUMNS)
+    staging = qn('firepoint_staging')
+    # Savepoint so a failed COPY leaves the surrounding transaction usable
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ("
+            "latitude double precision, longitude double precision, acq_date timestamptz, "
+            "brightness double precision, frp double precision, confidence integer"
+            ") ON COMMIT DROP"
+        )
+        cursor.copy_expert(f"COPY {staging} FROM STDIN WITH (FORMAT CSV)", buffer)
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}, {qn('geometry')}, {qn('created_at')}, {qn('updated_at')}) "
+            f"SELECT latitude, longitude, acq_date, brightness, frp, confidence, "
+            f"ST_SetSRID(ST_MakePoint(longitude, latitude), 4326), now(), now() "
+            f"FROM {staging}"
+        )
+        count = cursor.rowcount
+        cursor.execute(f"DROP TABLE {staging}")
+    return count
+
+def _parse_confidence(value):
+    """Return a non-negative whole confidence value as int, anything else as None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value) if value >= 0 and float(value).is_integer() else None
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
 
 class Province(models.Model):
     admin1Name = models.CharField(max_length=100)
@@ -75,11 +245,8 @@ class FirePoint(models.Model):
     brightness = models.FloatField(null=True, blank=True)
     acq_date = models.DateTimeField()
     frp = models.FloatField(null=True, blank=True)
-    confidence = models.IntegerField(
-        null=True, 
-        blank=True,
-        choices=[(i, str(i)) for i in range(0, 101, 10)]
-    )
+    # FIRMS confidence is a 0-100 percentage; the range is enforced by a database constraint
+    confidence = models.IntegerField(null=True, blank=True)
     geometry = models.PointField(srid=4326)
     created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
@@ -98,9 +265,16 @@ class FirePoint(models.Model):
         verbose_name_plural = "Fire Points"
         ordering = ['-acq_date']
         indexes = [
-            models.Index(fields=['acq_date']),
+            # Serves the API's date-range filter, newest-first ordering and confidence cut-off
+            models.Index(fields=['-acq_date', 'confidence'], name='firepoint_acq_conf_idx'),
             models.Index(fields=['latitude', 'longitude']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(confidence__gte=0) & models.Q(confidence__lte=100),
+                name='firepoint_conf_range',
+            ),
+        ]
 
 class GeoDataUpload(django_models.Model):
     DATA_TYPES = (
@@ -108,13 +282,13 @@ class GeoDataUpload(django_models.Model):
         ('province', 'Provinces'),
         ('district', 'Districts'),
     )
-    
+
     UPLOAD_FORMATS = (
         ('csv', 'CSV'),
         ('json', 'GeoJSON'),
         ('shp', 'Shapefile'),
     )
-    
+
     title = django_models.CharField(max_length=255)
     data_type = django_models.CharField(max_length=10, choices=DATA_TYPES)
     upload_format = django_models.CharField(max_length=10, choices=UPLOAD_FORMATS)
@@ -129,6 +303,7 @@ class GeoDataUpload(django_models.Model):
     created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
     processing_time = models.DurationField(null=True, blank=True)
+    queued_at = models.DateTimeField(null=True, blank=True, help_text="Set while waiting for or undergoing background processing")
 
     def __str__(self):
         return f"{self.title} ({self.get_data_type_display()})"
@@ -152,46 +327,81 @@ class GeoDataUpload(django_models.Model):
         elif self.data_type in ['province', 'district'] and self.upload_format not in ['json', 'shp']:
             raise ValidationError({'upload_format': 'Provinces/Districts only support GeoJSON or Shapefile format'})
 
-    def debug_geojson(self):
-        """Debug method to check GeoJSON structure and property matching"""
+    def debug_geojson(self, feature):
+        """Log the structure and property matching of a streamed feature (the first one of a file)"""
         try:
-            with open(self.data_file.path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            props = feature.get('properties') or {}
+            lowered = {k.lower() for k in props}
             
             logger.debug("\n=== GEOJSON DEBUG ===")
             logger.debug(f"File: {self.data_file.path}")
-            logger.debug(f"Type: {data.get('type')}")
-            logger.debug(f"Feature count: {len(data.get('features', []))}")
+            logger.debug("\nFirst feature properties:")
+            logger.debug(props)
             
-            if data.get('features'):
-                first_feature = data['features'][0]
-                logger.debug("\nFirst feature properties:")
-                logger.debug(first_feature.get('properties', {}))
-                
-                # Test property matching
-                props = first_feature.get('properties', {})
-                props_lower = {k.lower(): v for k, v in props.items()}
-                
-                logger.debug("\nProperty matching test:")
-                logger.debug(f"ADM1_PCODE found: {'adm1_pcode' in props_lower}")
-                logger.debug(f"ADM1_EN found: {'adm1_en' in props_lower}")
-                logger.debug(f"All lowercase props: {props_lower}")
-                
-                # Test geometry
-                if first_feature.get('geometry'):
-                    try:
-                        geom = GEOSGeometry(json.dumps(first_feature['geometry']))
-                        logger.debug(f"Geometry type: {geom.geom_type}")
-                        logger.debug(f"Geometry valid: {geom.valid}")
-                        logger.debug(f"Geometry area: {geom.area}")
-                    except Exception as e:
-                        logger.error(f"Geometry error: {str(e)}")
+            logger.debug("\nProperty matching test:")
+            logger.debug(f"ADM1_PCODE found: {'adm1_pcode' in lowered}")
+            logger.debug(f"ADM1_EN found: {'adm1_en' in lowered}")
+            
+            # Test geometry
+            if feature.get('geometry'):
+                try:
+                    geom = GEOSGeometry(orjson.dumps(feature['geometry']))
+                    logger.debug(f"Geometry type: {geom.geom_type}")
+                    logger.debug(f"Geometry valid: {geom.valid}")
+                    logger.debug(f"Geometry area: {geom.area}")
+                except Exception as e:
+                    logger.error(f"Geometry error: {str(e)}")
             
             return True
         except Exception as e:
             logger.error(f"Debug error: {str(e)}")
             return False
 
+    def _iter_geojson_features(self):
+        """Stream the features of the uploaded FeatureCollection one at a time"""
+        with open(self.data_file.path, 'rb') as f:
+            # The top-level type may follow the features, so find it with the event parser
+            geojson_type = next((value for prefix, event, value in ijson.parse(f) if prefix == 'type'), None)
+            if geojson_type != 'FeatureCollection':
+                raise ValueError("GeoJSON must be a FeatureCollection")
+            
+            f.seek(0)
+            yield from ijson.items(f, 'features.item', use_float=True)
+
+    def _bulk_upsert(self, model, objects, unique_field, update_fields, batch_size=500):
+        """Insert or update objects on their unique code and return how many were new"""
+        codes = [getattr(obj, unique_field) for obj in objects]
+        # One transaction for the pre-select and every batch, even when called outside process()
+        with transaction.atomic():
+            existing = set(
+                model.objects.filter(**{f'{unique_field}__in': codes}).values_list(unique_field, flat=True)
+            )
+            
+            model.objects.bulk_create(
+                objects,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=[unique_field],
+                update_fields=update_fields + ['updated_at'],
+            )
+        
+        name = model._meta.verbose_name.lower()
+        for code in codes:
+            if code in existing:
+                logger.info(f"Updated existing {name}: {code}")
+            else:
+                logger.info(f"Created new {name}: {code}")
+        return len(codes) - len(existing)
+
+    def _province_lookups(self):
+        """Map province codes and names to Province rows, without loading geometries"""
+        by_pcod = {}
+        by_name = {}
+        for province in Province.objects.only('id', 'admin1Pcod', 'admin1Name'):
+            by_pcod[province.admin1Pcod] = province
+            by_name.setdefault(province.admin1Name, province)  # first match, like .first()
+        return by_pcod, by_name
+
     def process(self):
         start_time = datetime.now()
         self.processing_errors = None
@@ -203,10 +413,6 @@ class GeoDataUpload(django_models.Model):
             if not os.path.exists(self.data_file.path):
                 raise FileNotFoundError(f"File not found at {self.data_file.path}")
             
-            # Run debug first (skip for shapefiles)
-            if self.upload_format != 'shp':
-                self.debug_geojson()
-            
             with transaction.atomic():
                 if self.data_type == 'province':
                     if self.upload_format == 'shp':
@@ -246,26 +452,20 @@ class GeoDataUpload(django_models.Model):
     def _process_provinces_geojson_enhanced(self):
         """Enhanced GeoJSON processor with detailed logging"""
         try:
-            # Load the GeoJSON file with detailed logging
-            with open(self.data_file.path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"Loaded GeoJSON file: {self.data_file.path}")
-                logger.debug(f"GeoJSON type: {data.get('type')}")
-                logger.debug(f"Number of features: {len(data.get('features', []))}")
-            
-            # Validate GeoJSON structure
-            if data.get('type') != 'FeatureCollection':
-                raise ValueError("GeoJSON must be a FeatureCollection")
+            # Stream features from the GeoJSON file (validates the FeatureCollection type)
+            features = self._iter_geojson_features()
+            logger.info(f"Streaming GeoJSON file: {self.data_file.path}")
             
-            features = data.get('features', [])
-            created_count = 0
+            total_count = 0
             skipped_count = 0
-            
-            logger.info(f"Found {len(features)} features to process")
+            provinces = {}  # keyed by PCODE so a repeated code keeps its last feature
+            debug = logger.isEnabledFor(logging.DEBUG)
             
             for i, feature in enumerate(features):
+                total_count += 1
                 try:
-                    logger.debug(f"\n=== Processing feature {i} ===")
+                    if debug and i == 0:
+                        self.debug_geojson(feature)
                     
                     # Skip features without geometry
                     if not feature.get('geometry'):
@@ -275,13 +475,11 @@ class GeoDataUpload(django_models.Model):
                     
                     # Extract properties with enhanced logging
                     props = feature.get('properties', {})
-                    props_lower = {k.lower(): v for k, v in props.items()}
-                    logger.debug(f"All properties (original case): {props}")
-                    logger.debug(f"All properties (lowercase): {props_lower}")
                     
                     # Get province code and name with flexible field matching
-                    pcod = props.get('ADM1_PCODE') or props_lower.get('adm1_pcode')
-                    name = props.get('ADM1_EN') or props_lower.get('adm1_en')
+                    matched = _match_properties(props, PROVINCE_FIELD_ALIASES)
+                    pcod = matched.get('pcod')
+                    name = matched.get('name')
                     
                     if not pcod:
                         logger.error(f"Feature {i} missing PCODE - available properties: {list(props.keys())}")
@@ -292,20 +490,13 @@ class GeoDataUpload(django_models.Model):
                         skipped_count += 1
                         continue
                     
-                    logger.debug(f"Extracted values - PCODE: {pcod}, NAME: {name}")
-                    
                     # Process geometry with validation
                     try:
                         geometry_data = feature['geometry']
-                        logger.debug(f"Geometry type from data: {geometry_data.get('type')}")
-                        
-                        geometry = GEOSGeometry(json.dumps(geometry_data))
-                        logger.debug(f"GEOS Geometry type: {geometry.geom_type}")
-                        logger.debug(f"GEOS Geometry valid: {geometry.valid}")
+                        geometry = GEOSGeometry(orjson.dumps(geometry_data))
                         
                         # Handle both Polygon and MultiPolygon
                         if geometry.geom_type == 'Polygon':
-                            logger.debug("Converting Polygon to MultiPolygon")
                             geometry = MultiPolygon([geometry])
                         elif geometry.geom_type != 'MultiPolygon':
                             logger.warning(f"Feature {i} has unsupported geometry type: {geometry.geom_type}")
@@ -315,33 +506,13 @@ class GeoDataUpload(django_models.Model):
                         # Validate geometry
                         if not geometry.valid:
                             logger.warning(f"Feature {i} has invalid geometry - attempting to fix")
-                            original_area = geometry.area
-                            geometry = geometry.buffer(0)
-                            logger.debug(f"Fixed geometry - Valid: {geometry.valid}, Original area: {original_area}, New area: {geometry.area}")
-                            if not geometry.valid:
+                            geometry = _make_valid_multipolygon(geometry)
+                            if geometry is None or not geometry.valid:
                                 logger.error(f"Could not fix invalid geometry for feature {i}")
                                 skipped_count += 1
                                 continue
                         
-                        # Check if province already exists
-                        existing = Province.objects.filter(admin1Pcod=pcod).first()
-                        if existing:
-                            logger.debug(f"Province with PCODE {pcod} already exists (ID: {existing.id})")
-                        
-                        # Create or update province
-                        province, created = Province.objects.update_or_create(
-                            admin1Pcod=pcod,
-                            defaults={
-                                'admin1Name': name,
-                                'geometry': geometry
-                            }
-                        )
-                        
-                        if created:
-                            created_count += 1
-                            logger.info(f"Created new province: {name} ({pcod})")
-                        else:
-                            logger.info(f"Updated existing province: {name} ({pcod})")
+                        provinces[pcod] = Province(admin1Pcod=pcod, admin1Name=name, geometry=geometry)
                             
                     except Exception as geom_error:
                         logger.error(f"Geometry processing error for feature {i}: {str(geom_error)}", exc_info=True)
@@ -353,10 +524,15 @@ class GeoDataUpload(django_models.Model):
                     skipped_count += 1
                     continue
             
+            # Create or update all provinces in a few set-based upserts
+            created_count = self._bulk_upsert(
+                Province, list(provinces.values()), 'admin1Pcod', ['admin1Name', 'geometry']
+            )
+            
             logger.info(f"\n=== Processing Summary ===")
-            logger.info(f"Total features: {len(features)}")
+            logger.info(f"Total features: {total_count}")
             logger.info(f"Created: {created_count}")
-            logger.info(f"Updated: {len(features) - created_count - skipped_count}")
+            logger.info(f"Updated: {total_count - created_count - skipped_count}")
             logger.info(f"Skipped: {skipped_count}")
             logger.info(f"Finished processing. Total provinces created/updated: {created_count}")
             
@@ -370,21 +546,20 @@ class GeoDataUpload(django_models.Model):
     def _process_districts_geojson_enhanced(self):
         """Enhanced districts GeoJSON processor with flexible property matching"""
         try:
-            with open(self.data_file.path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if data.get('type') != 'FeatureCollection':
-                raise ValueError("GeoJSON must be a FeatureCollection")
-            
-            features = data.get('features', [])
-            created_count = 0
+            features = self._iter_geojson_features()
+            total_count = 0
             skipped_count = 0
+            districts = {}  # keyed by PCODE so a repeated code keeps its last feature
+            debug = logger.isEnabledFor(logging.DEBUG)
             
-            logger.info(f"Found {len(features)} district features to process")
+            # Load the (small) province table once instead of querying it per feature
+            provinces_by_pcod, provinces_by_name = self._province_lookups()
             
             for i, feature in enumerate(features):
+                total_count += 1
                 try:
-                    logger.debug(f"\n=== Processing district feature {i} ===")
+                    if debug and i == 0:
+                        self.debug_geojson(feature)
                     
                     # Skip features without geometry
                     if not feature.get('geometry'):
@@ -393,15 +568,13 @@ class GeoDataUpload(django_models.Model):
                         continue
                         
                     props = feature.get('properties', {})
-                    props_lower = {k.lower(): v for k, v in props.items()}
-                    logger.debug(f"All properties (original case): {props}")
-                    logger.debug(f"All properties (lowercase): {props_lower}")
                     
                     # Flexible property matching for district fields
-                    pcod = props.get('admin2Pcod') or props_lower.get('admin2pcod') or props_lower.get('adm2_pcode') or props_lower.get('pcode')
-                    name = props.get('admin2Name') or props_lower.get('admin2name') or props_lower.get('adm2_en') or props_lower.get('name')
-                    parent_pcod = props.get('admin1Pcod') or props_lower.get('admin1pcod') or props_lower.get('adm1_pcode')
-                    parent_name = props.get('admin1Name') or props_lower.get('admin1name') or props_lower.get('adm1_en')
+                    matched = _match_properties(props, DISTRICT_FIELD_ALIASES)
+                    pcod = matched.get('pcod')
+                    name = matched.get('name')
+                    parent_pcod = matched.get('parent_pcod')
+                    parent_name = matched.get('parent_name')
                     
                     if not pcod:
                         logger.error(f"Feature {i} missing district PCODE - available properties: {list(props.keys())}")
@@ -412,13 +585,10 @@ class GeoDataUpload(django_models.Model):
                         skipped_count += 1
                         continue
                     
-                    logger.debug(f"Extracted values - District PCODE: {pcod}, Name: {name}")
-                    logger.debug(f"Parent province - PCODE: {parent_pcod}, Name: {parent_name}")
-                    
                     # Process geometry
                     try:
                         geometry_data = feature['geometry']
-                        geometry = GEOSGeometry(json.dumps(geometry_data))
+                        geometry = GEOSGeometry(orjson.dumps(geometry_data))
                         
                         if geometry.geom_type == 'Polygon':
                             geometry = MultiPolygon([geometry])
@@ -429,8 +599,8 @@ class GeoDataUpload(django_models.Model):
                         
                         if not geometry.valid:
                             logger.warning(f"Feature {i} has invalid geometry - attempting to fix")
-                            geometry = geometry.buffer(0)
-                            if not geometry.valid:
+                            geometry = _make_valid_multipolygon(geometry)
+                            if geometry is None or not geometry.valid:
                                 logger.error(f"Could not fix invalid geometry for feature {i}")
                                 skipped_count += 1
                                 continue
@@ -438,29 +608,17 @@ class GeoDataUpload(django_models.Model):
                         # Find related province
                         province = None
                         if parent_pcod:
-                            province = Province.objects.filter(admin1Pcod=parent_pcod).first()
+                            province = provinces_by_pcod.get(parent_pcod)
                         elif parent_name:
-                            province = Province.objects.filter(admin1Name=parent_name).first()
-                        
-                        if province:
-                            logger.debug(f"Found parent province: {province.admin1Name} ({province.admin1Pcod})")
+                            province = provinces_by_name.get(parent_name)
                         
-                        # Create or update district
-                        district, created = District.objects.update_or_create(
+                        districts[pcod] = District(
                             admin2Pcod=pcod,
-                            defaults={
-                                'admin2Name': name,
-                                'admin1Name': parent_name or (province.admin1Name if province else ''),
-                                'province': province,
-                                'geometry': geometry
-                            }
+                            admin2Name=name,
+                            admin1Name=parent_name or (province.admin1Name if province else ''),
+                            province=province,
+                            geometry=geometry
                         )
-                        
-                        if created:
-                            created_count += 1
-                            logger.info(f"Created new district: {name} ({pcod})")
-                        else:
-                            logger.info(f"Updated existing district: {name} ({pcod})")
                             
                     except Exception as geom_error:
                         logger.error(f"Geometry processing error for feature {i}: {str(geom_error)}", exc_info=True)
@@ -472,10 +630,16 @@ class GeoDataUpload(django_models.Model):
                     skipped_count += 1
                     continue
             
+            # Create or update all districts in a few set-based upserts
+            created_count = self._bulk_upsert(
+                District, list(districts.values()), 'admin2Pcod',
+                ['admin2Name', 'admin1Name', 'province', 'geometry']
+            )
+            
             logger.info(f"\n=== District Processing Summary ===")
-            logger.info(f"Total features: {len(features)}")
+            logger.info(f"Total features: {total_count}")
             logger.info(f"Created: {created_count}")
-            logger.info(f"Updated: {len(features) - created_count - skipped_count}")
+            logger.info(f"Updated: {total_count - created_count - skipped_count}")
             logger.info(f"Skipped: {skipped_count}")
             logger.info(f"Finished processing. Total districts created/updated: {created_count}")
             
@@ -496,37 +660,66 @@ class GeoDataUpload(django_models.Model):
             missing = required_columns - set(df.columns)
             raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
         
-        firepoints = []
-        for _, row in df.iterrows():
+        # Coerce whole columns at once; unparseable values become NaN/NaT and are dropped below
+        df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+        df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+        acq_date = pd.to_datetime(df['acq_date'], format=ACQ_DATE_FORMAT, errors='coerce', utc=True)
+        # Only values in some other layout go through the slower inferring parser
+        fallback = acq_date.isna() & df['acq_date'].notna()
+        if fallback.any():
+            acq_date[fallback] = pd.to_datetime(df.loc[fallback, 'acq_date'], format='mixed', errors='coerce', utc=True)
+        df['acq_date'] = acq_date
+        for column in ('brightness', 'frp'):
+            df[column] = pd.to_numeric(df[column], errors='coerce') if column in df.columns else 0.0
+        
+        # Missing, non-numeric, negative or fractional confidence values become NA (stored as NULL)
+        if 'confidence' in df.columns:
+            confidence = pd.to_numeric(df['confidence'], errors='coerce')
+            confidence = confidence.where((confidence >= 0) & (confidence % 1 == 0)).astype('Int64')
+        else:
+            confidence = pd.Series(pd.NA, index=df.index, dtype='Int64')
+        
+        # Coordinate bounds, plus the confidence range the database constraint enforces
+        valid = (
+            df['acq_date'].notna()
+            & df['latitude'].between(-90, 90)
+            & df['longitude'].between(-180, 180)
+            & (confidence.isna() | (confidence <= 100))
+        )
+        if not valid.all():
+            logger.error(f"Skipping {int((~valid).sum())} invalid rows in {self.data_file.name}")
+        df = df[valid]
+        confidence = confidence[valid]
+        
+        if connection.vendor == 'postgresql':
             try:
-                try:
-                    acq_date = pd.to_datetime(row['acq_date'])
-                    if not acq_date.tzinfo:
-                        acq_date = make_aware(acq_date)
-                except (ValueError, TypeError) as e:
-                    raise ValueError(f"Invalid date format in row {_}: {row['acq_date']}")
-                
-                fp = FirePoint(
-                    latitude=float(row['latitude']),
-                    longitude=float(row['longitude']),
-                    acq_date=acq_date,
-                    brightness=float(row.get('brightness', 0)),
-                    frp=float(row.get('frp', 0)),
-                    confidence=int(row.get('confidence', 0)) if str(row.get('confidence', '')).isdigit() else None,
-                    geometry=Point(float(row['longitude']), float(row['latitude']))
-                )
-                
-                fp.full_clean()
-                firepoints.append(fp)
-                
+                return True, copy_firepoints(df.assign(confidence=confidence))
             except Exception as e:
-                logger.error(f"Error processing row {_}: {str(e)}")
-                continue
+                logger.error(f"COPY into firepoints failed: {str(e)}")
+                return False, 0
+        
+        firepoints = [
+            FirePoint(
+                latitude=lat,
+                longitude=lon,
+                acq_date=acq_date,
+                brightness=brightness,
+                frp=frp,
+                confidence=conf,
+                geometry=Point(lon, lat, srid=4326)
+            )
+            for lat, lon, acq_date, brightness, frp, conf in zip(
+                df['latitude'].tolist(),
+                df['longitude'].tolist(),
+                df['acq_date'].dt.to_pydatetime(),
+                _nullable(df['brightness']),
+                _nullable(df['frp']),
+                _nullable(confidence),
+            )
+        ]
         
         try:
-            batch_size = 1000
-            for i in range(0, len(firepoints), batch_size):
-                FirePoint.objects.bulk_create(firepoints[i:i+batch_size])
+            FirePoint.objects.bulk_create(firepoints, batch_size=settings.FIREPOINT_BULK_BATCH_SIZE)
             return True, len(firepoints)
         except Exception as e:
             logger.error(f"Bulk create failed: {str(e)}")
@@ -534,14 +727,11 @@ class GeoDataUpload(django_models.Model):
 
     def _process_firepoints_geojson(self):
         try:
-            with open(self.data_file.path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if data.get('type') != 'FeatureCollection':
-                raise ValueError("GeoJSON must be a FeatureCollection")
-            
-            features = data.get('features', [])
+            features = self._iter_geojson_features()
+            batch_size = settings.FIREPOINT_BULK_BATCH_SIZE
             firepoints = []
+            created_count = 0
+            date_format = None  # sniffed from the first dated feature
             
             for i, feature in enumerate(features):
                 try:
@@ -550,56 +740,71 @@ class GeoDataUpload(django_models.Model):
                         continue
                         
                     props = feature.get('properties', {})
-                    coords = feature['geometry']['coordinates']
+                    longitude, latitude = feature['geometry']['coordinates'][:2]
+                    
+                    # Plain range checks instead of a per-instance full_clean()
+                    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                        raise ValueError(f"Coordinates out of range: {longitude}, {latitude}")
+                    confidence = _parse_confidence(props.get('confidence'))
+                    if confidence is not None and not 0 <= confidence <= 100:
+                        raise ValueError(f"Invalid confidence value: {confidence}")
                     
                     if 'acq_date' not in props:
                         raise ValueError("Missing acq_date property")
                     
+                    raw_date = props['acq_date']
+                    if date_format is None and isinstance(raw_date, str):
+                        date_format = ACQ_DATE_FORMAT if ACQ_DATE_PATTERN.match(raw_date) else ''
                     try:
-                        acq_date = pd.to_datetime(props['acq_date'])
+                        try:
+                            acq_date = datetime.strptime(raw_date, date_format) if date_format else pd.to_datetime(raw_date)
+                        except (ValueError, TypeError):
+                            acq_date = pd.to_datetime(raw_date)
                         if not acq_date.tzinfo:
                             acq_date = make_aware(acq_date)
                     except (ValueError, TypeError) as e:
-                        raise ValueError(f"Invalid date format: {props['acq_date']}")
+                        raise ValueError(f"Invalid date format: {raw_date}")
                     
-                    fp = FirePoint(
-                        latitude=coords[1],
-                        longitude=coords[0],
+                    firepoints.append(FirePoint(
+                        latitude=latitude,
+                        longitude=longitude,
                         brightness=props.get('brightness'),
                         acq_date=acq_date,
                         frp=props.get('frp'),
-                        confidence=int(props.get('confidence', 0)) if str(props.get('confidence', '')).isdigit() else None,
-                        geometry=Point(coords[0], coords[1])
-                    )
-                    
-                    fp.full_clean()
-                    firepoints.append(fp)
+                        confidence=confidence,
+                        geometry=Point(longitude, latitude, srid=4326)
+                    ))
                     
                 except Exception as e:
                     logger.error(f"Error processing feature {i}: {str(e)}")
                     continue
-            
-            batch_size = 1000
-            for i in range(0, len(firepoints), batch_size):
-                FirePoint.objects.bulk_create(firepoints[i:i+batch_size])
-            return True, len(firepoints)
+                
+                # Flush each full batch so only one batch of instances is held in memory
+                if len(firepoints) >= batch_size:
+                    FirePoint.objects.bulk_create(firepoints, batch_size=batch_size)
+                    created_count += len(firepoints)
+                    firepoints.clear()
+            
+            FirePoint.objects.bulk_create(firepoints, batch_size=batch_size)
+            created_count += len(firepoints)
+            return True, created_count
             
         except Exception as e:
             logger.error(f"Failed to process GeoJSON: {str(e)}")
             raise
 
     def _process_shapefile(self, data_type):
-        from django.contrib.gis.gdal import DataSource
-        
         temp_dir = None
         try:
             # Create a uniquely named temporary directory
             temp_dir = tempfile.mkdtemp(prefix='geodata_')
             logger.info(f"Created temporary directory: {temp_dir}")
             
-            # Extract the zip file
+            # Extract only the shapefile components OGR reads, not docs/metadata/thumbnails
             with zipfile.ZipFile(self.data_file.path) as zip_ref:
-                zip_ref.extractall(temp_dir)
+                for member in zip_ref.infolist():
+                    if os.path.splitext(member.filename)[1].lower() in SHAPEFILE_EXTENSIONS:
+                        zip_ref.extract(member, temp_dir)
                 logger.info(f"Extracted shapefile to: {temp_dir}")
             
             # Find the .shp file
@@ -612,20 +817,17 @@ class GeoDataUpload(django_models.Model):
             
             # Process the shapefile with explicit cleanup
             try:
-                # Open the DataSource in a context manager if possible
-                ds = DataSource(shp_path)
-                layer = ds[0]
+                field_names, features = _read_shapefile(shp_path)
                 
                 if data_type == 'province':
-                    result, count = self._process_shapefile_provinces(layer)
+                    result, count = self._process_shapefile_provinces(field_names, features)
                 elif data_type == 'district':
-                    result, count = self._process_shapefile_districts(layer)
+                    result, count = self._process_shapefile_districts(field_names, features)
                 else:
                     raise ValueError(f"Unknown data type for shapefile: {data_type}")
                 
-                # Explicitly close the DataSource and release resources
-                del layer
-                del ds
+                # Release the features (and any open GDAL layer) before the temp dir is removed
+                del features
                 
                 return result, count
                 
@@ -643,58 +845,32 @@ class GeoDataUpload(django_models.Model):
                 logger.info(f"Cleaning up temporary directory: {temp_dir}")
                 self._cleanup_temp_dir(temp_dir)
 
-    def _process_shapefile_provinces(self, layer):
-        created_count = 0
+    def _process_shapefile_provinces(self, field_names, features):
+        provinces = {}  # keyed by PCODE so a repeated code keeps its last feature
         
         try:
-            # Get field names - handle different GDAL versions
-            if hasattr(layer, 'fields'):  # Newer GDAL versions
-                if callable(layer.fields):  # If it's a method
-                    field_names = layer.fields()
-                else:  # If it's a property
-                    field_names = layer.fields
-            else:  # Older GDAL versions
-                field_names = [field.name for field in layer.schema]
-            
-            # Create field map (lowercase field names to original names)
-            field_map = {name.lower(): name for name in field_names}
+            # Create field map (lowercase field names to column positions)
+            field_map = {name.lower(): index for index, name in enumerate(field_names)}
             logger.debug(f"Field map: {field_map}")
             
-            for i, feature in enumerate(layer):
+            # The layer schema is fixed, so resolve each field's candidate columns once
+            pcod_fields = [field_map[field] for field in ['admin1pcod', 'pcod', 'adm1_pcode', 'pcode', 'adm1_pcod'] if field in field_map]
+            name_fields = [field_map[field] for field in ['admin1name', 'name', 'adm1_en', 'adm1name', 'adm1name_en'] if field in field_map]
+            
+            for i, (values, geometry) in enumerate(features):
                 try:
-                    if not feature.geom:
+                    if geometry is None:
                         logger.warning(f"Feature {i} has no geometry - skipping")
                         continue
                         
-                    pcod = None
-                    name = None
-                    
-                    # Check all possible field name variations
-                    for field in ['admin1pcod', 'pcod', 'adm1_pcode', 'pcode', 'adm1_pcod']:
-                        if field in field_map:
-                            try:
-                                pcod = feature.get(field_map[field])
-                                if pcod:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
-                    
-                    for field in ['admin1name', 'name', 'adm1_en', 'adm1name', 'adm1name_en']:
-                        if field in field_map:
-                            try:
-                                name = feature.get(field_map[field])
-                                if name:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
+                    # Take the first resolved column that has a value
+                    pcod = _first_value(values, pcod_fields)
+                    name = _first_value(values, name_fields)
                     
                     if not pcod or not name:
                         logger.warning(f"Feature {i} missing required fields - skipping")
                         continue
                         
-                    geometry = GEOSGeometry(feature.geom.wkt)
                     if not isinstance(geometry, (Polygon, MultiPolygon)):
                         logger.warning(f"Feature {i} geometry is not a Polygon/MultiPolygon - skipping")
                         continue
@@ -703,27 +879,21 @@ class GeoDataUpload(django_models.Model):
                     if isinstance(geometry, Polygon):
                         geometry = MultiPolygon([geometry])
                     
-                    # Validate geometry
-                    if not geometry.valid:
-                        logger.warning(f"Feature {i} has invalid geometry - attempting to fix")
-                        geometry = geometry.buffer(0)
-                    
-                    province, created = Province.objects.update_or_create(
-                        admin1Pcod=pcod,
-                        defaults={
-                            'admin1Name': name,
-                            'geometry': geometry
-                        }
-                    )
-                    if created:
-                        created_count += 1
-                        logger.info(f"Created new province: {name} ({pcod})")
-                    else:
-                        logger.info(f"Updated existing province: {name} ({pcod})")
+                    provinces[pcod] = Province(admin1Pcod=pcod, admin1Name=name, geometry=geometry)
                         
                 except Exception as e:
                     logger.error(f"Error processing shapefile feature {i}: {str(e)}", exc_info=True)
                     continue
+            
+            # Create or update all provinces in a few set-based upserts
+            created_count = self._bulk_upsert(
+                Province, list(provinces.values()), 'admin1Pcod', ['admin1Name', 'geometry']
+            )
+            
+            # Validity is checked by the database after the load rather than per feature
+            repaired = _repair_geometries(Province.objects.filter(admin1Pcod__in=list(provinces)))
+            if repaired:
+                logger.warning(f"Repaired {repaired} invalid province geometries")
         
         except Exception as e:
             logger.error(f"Error setting up shapefile processing: {str(e)}", exc_info=True)
@@ -732,80 +902,39 @@ class GeoDataUpload(django_models.Model):
         logger.info(f"Finished processing. Total provinces created/updated: {created_count}")
         return True, created_count
 
-    def _process_shapefile_districts(self, layer):
-        created_count = 0
+    def _process_shapefile_districts(self, field_names, features):
+        districts = {}  # keyed by PCODE so a repeated code keeps its last feature
         
         try:
-            # Get field names - handle different GDAL versions
-            if hasattr(layer, 'fields'):  # Newer GDAL versions
-                if callable(layer.fields):  # If it's a method
-                    field_names = layer.fields()
-                else:  # If it's a property
-                    field_names = layer.fields
-            else:  # Older GDAL versions
-                field_names = [field.name for field in layer.schema]
-            
-            # Create field map (lowercase field names to original names)
-            field_map = {name.lower(): name for name in field_names}
+            # Create field map (lowercase field names to column positions)
+            field_map = {name.lower(): index for index, name in enumerate(field_names)}
             logger.debug(f"Field map: {field_map}")
             
-            for i, feature in enumerate(layer):
+            # The layer schema is fixed, so resolve each field's candidate columns once
+            pcod_fields = [field_map[field] for field in ['admin2pcod', 'pcod', 'adm2_pcode', 'pcode', 'adm2_pcod'] if field in field_map]
+            name_fields = [field_map[field] for field in ['admin2name', 'name', 'adm2_en', 'adm2name', 'adm2name_en'] if field in field_map]
+            parent_pcod_fields = [field_map[field] for field in ['admin1pcod', 'parentpcod', 'adm1_pcode', 'adm1_pcod'] if field in field_map]
+            parent_name_fields = [field_map[field] for field in ['admin1name', 'parentname', 'adm1_en', 'adm1name', 'adm1name_en'] if field in field_map]
+            
+            # Load the (small) province table once instead of querying it per feature
+            provinces_by_pcod, provinces_by_name = self._province_lookups()
+            
+            for i, (values, geometry) in enumerate(features):
                 try:
-                    if not feature.geom:
+                    if geometry is None:
                         logger.warning(f"Feature {i} has no geometry - skipping")
                         continue
                         
-                    pcod = None
-                    name = None
-                    parent_pcod = None
-                    parent_name = None
-                    
-                    # Check all possible field name variations
-                    for field in ['admin2pcod', 'pcod', 'adm2_pcode', 'pcode', 'adm2_pcod']:
-                        if field in field_map:
-                            try:
-                                pcod = feature.get(field_map[field])
-                                if pcod:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
-                    
-                    for field in ['admin2name', 'name', 'adm2_en', 'adm2name', 'adm2name_en']:
-                        if field in field_map:
-                            try:
-                                name = feature.get(field_map[field])
-                                if name:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
-                    
-                    for field in ['admin1pcod', 'parentpcod', 'adm1_pcode', 'adm1_pcod']:
-                        if field in field_map:
-                            try:
-                                parent_pcod = feature.get(field_map[field])
-                                if parent_pcod:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
-                    
-                    for field in ['admin1name', 'parentname', 'adm1_en', 'adm1name', 'adm1name_en']:
-                        if field in field_map:
-                            try:
-                                parent_name = feature.get(field_map[field])
-                                if parent_name:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Error getting field {field}: {str(e)}")
-                                continue
+                    # Take the first resolved column that has a value
+                    pcod = _first_value(values, pcod_fields)
+                    name = _first_value(values, name_fields)
+                    parent_pcod = _first_value(values, parent_pcod_fields)
+                    parent_name = _first_value(values, parent_name_fields)
                     
                     if not pcod or not name:
                         logger.warning(f"Feature {i} missing required fields - skipping")
                         continue
                         
-                    geometry = GEOSGeometry(feature.geom.wkt)
                     if not isinstance(geometry, (Polygon, MultiPolygon)):
                         logger.warning(f"Feature {i} geometry is not a Polygon/MultiPolygon - skipping")
                         continue
@@ -814,35 +943,34 @@ class GeoDataUpload(django_models.Model):
                     if isinstance(geometry, Polygon):
                         geometry = MultiPolygon([geometry])
                     
-                    # Validate geometry
-                    if not geometry.valid:
-                        logger.warning(f"Feature {i} has invalid geometry - attempting to fix")
-                        geometry = geometry.buffer(0)
-                    
                     province = None
                     if parent_pcod:
-                        province = Province.objects.filter(admin1Pcod=parent_pcod).first()
+                        province = provinces_by_pcod.get(parent_pcod)
                     elif parent_name:
-                        province = Province.objects.filter(admin1Name=parent_name).first()
+                        province = provinces_by_name.get(parent_name)
                     
-                    district, created = District.objects.update_or_create(
+                    districts[pcod] = District(
                         admin2Pcod=pcod,
-                        defaults={
-                            'admin2Name': name,
-                            'admin1Name': parent_name or '',
-                            'province': province,
-                            'geometry': geometry
-                        }
+                        admin2Name=name,
+                        admin1Name=parent_name or '',
+                        province=province,
+                        geometry=geometry
                     )
-                    if created:
-                        created_count += 1
-                        logger.info(f"Created new district: {name} ({pcod})")
-                    else:
-                        logger.info(f"Updated existing district: {name} ({pcod})")
                         
                 except Exception as e:
                     logger.error(f"Error processing shapefile feature {i}: {str(e)}", exc_info=True)
                     continue
+            
+            # Create or update all districts in a few set-based upserts
+            created_count = self._bulk_upsert(
+                District, list(districts.values()), 'admin2Pcod',
+                ['admin2Name', 'admin1Name', 'province', 'geometry']
+            )
+            
+            # Validity is checked by the database after the load rather than per feature
+            repaired = _repair_geometries(District.objects.filter(admin2Pcod__in=list(districts)))
+            if repaired:
+                logger.warning(f"Repaired {repaired} invalid district geometries")
         
         except Exception as e:
             logger.error(f"Error setting up shapefile processing: {str(e)}", exc_info=True)
@@ -851,42 +979,18 @@ class GeoDataUpload(django_models.Model):
         logger.info(f"Finished processing. Total districts created/updated: {created_count}")
         return True, created_count
 
-    def _cleanup_temp_dir(self, temp_dir):
-        """Robust temporary directory cleanup with retries and error handling"""
-        max_attempts = 5
-        delay = 0.5  # seconds between retries
-        
-        for attempt in range(max_attempts):
+    def _cleanup_temp_dir(self, temp_dir, retry_delay=0.5):
+        """Remove the temporary directory, retrying once for files that are still held open (e.g. on Windows)"""
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        if os.path.exists(temp_dir):
+            time.sleep(retry_delay)
             try:
-                # First try to remove all files
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.unlink(file_path)
-                            logger.debug(f"Deleted file: {file_path}")
-                        except Exception as e:
-                            logger.warning(f"Could not delete file {file_path}: {str(e)}")
-                            if attempt == max_attempts - 1:
-                                raise
-                
-                # Then try to remove the directory itself
-                try:
-                    os.rmdir(temp_dir)
-                    logger.info(f"Successfully removed temp directory: {temp_dir}")
-                    return
-                except OSError as e:
-                    if attempt == max_attempts - 1:
-                        logger.error(f"Failed to remove temp directory {temp_dir}: {str(e)}")
-                        raise
-            
-            except Exception as e:
-                if attempt == max_attempts - 1:
-                    logger.error(f"Final attempt failed to cleanup temp dir {temp_dir}: {str(e)}")
-                    # At this point, we've tried our best - log the error but don't crash
-                    return
-                time.sleep(delay)
-                delay *= 2  # Exponential backoff
+                shutil.rmtree(temp_dir)
+            except OSError as e:
+                # We've tried our best - log the error but don't crash
+                logger.error(f"Failed to remove temp directory {temp_dir}: {str(e)}")
+                return
+        logger.info(f"Successfully removed temp directory: {temp_dir}")
 
     class Meta:
         verbose_name = "Geo Data Upload"
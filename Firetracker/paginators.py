@@ -0,0 +1,53 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CachingPaginator(Paginator):
+    """Paginator that memoizes the changelist COUNT(*) in the cache for a short time"""
+    cache_timeout = 60  # seconds
+
+    @cached_property
+    def count(self):
+        try:
+            sql = str(self.object_list.query)
+        except Exception:
+            # Not a queryset, or a query that can never match (EmptyResultSet)
+            return super().count
+
+        cache_key = f"adm:count:{hashlib.md5(sql.encode('utf-8')).hexdigest()}"
+        count = cache.get(cache_key)
+        if count is None:
+            count = super().count
+            cache.set(cache_key, count, timeout=self.cache_timeout)
+        return count
+
+class ApproxCountPaginator(CachingPaginator):
+    """Paginator that uses the PostgreSQL planner estimate for unfiltered changelists"""
+    exact_count_threshold = 10000  # below this an exact COUNT(*) is cheap enough
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        db = self.object_list.db
+        connection = connections[db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        table = connection.ops.quote_name(self.object_list.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+            row = cursor.fetchone()
+
+        # reltuples is -1 (or 0) until the table has been analyzed
+        estimate = row[0] if row else -1
+        if estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
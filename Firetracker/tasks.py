@@ -0,0 +1,40 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection, transaction
+from django.utils import timezone
+from .models import GeoDataUpload
+
+logger = logging.getLogger(__name__)
+
+# One worker thread per process: shapefile imports are DB-heavy, so they are queued
+# rather than run side by side, and the request thread is released straight away.
+# Jobs live only in memory; an upload whose queued_at is never cleared was dropped by a
+# restart and can be re-run with the "Process selected" action.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='geodata-upload')
+
+def enqueue_upload(upload):
+    """Mark an upload as queued and process it in the background once the transaction commits"""
+    upload.queued_at = timezone.now()
+    GeoDataUpload.objects.filter(pk=upload.pk).update(queued_at=upload.queued_at, processing_errors=None)
+    upload_id = upload.pk
+    transaction.on_commit(lambda: _executor.submit(_process_upload, upload_id))
+
+def _process_upload(upload_id):
+    try:
+        upload = GeoDataUpload.objects.get(pk=upload_id)
+        logger.info(f"Background processing of upload {upload.id} - {upload.title}")
+        if not upload.process():
+            logger.error(f"Background processing failed for {upload.title}: {upload.processing_errors}")
+            if not upload.processing_errors:
+                GeoDataUpload.objects.filter(pk=upload_id).update(
+                    processing_errors="Background processing failed - see server logs"
+                )
+    except Exception as e:
+        logger.error(f"Background processing error for upload {upload_id}: {str(e)}", exc_info=True)
+        GeoDataUpload.objects.filter(pk=upload_id).update(
+            processing_errors=f"Background processing error: {str(e)}"
+        )
+    finally:
+        GeoDataUpload.objects.filter(pk=upload_id).update(queued_at=None)
+        # The worker thread has its own connection; don't leave it open between jobs
+        connection.close()
@@ -0,0 +1,81 @@
+import os
+import struct
+import tempfile
+from datetime import datetime, timezone
+
+from django.contrib import admin
+from django.contrib.admin.utils import lookup_field
+from django.test import SimpleTestCase
+
+from .admin import ProvinceAdmin
+from .models import Province, _read_shapefile
+
+try:
+    import numpy as np
+    from pyogrio.raw import write as write_ogr
+except ImportError:
+    write_ogr = None
+
+
+def _square_wkb(x, y):
+    """Little-endian WKB for a closed unit square Polygon at (x, y)"""
+    ring = [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1), (x, y)]
+    return struct.pack('<BIII', 1, 3, 1, len(ring)) + b''.join(struct.pack('<2d', *pt) for pt in ring)
+
+
+class ReadShapefileTests(SimpleTestCase):
+    def setUp(self):
+        if write_ogr is None:
+            self.skipTest('pyogrio is needed to write the fixture shapefile')
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.shp_path = os.path.join(self.temp_dir.name, 'provinces.shp')
+        write_ogr(
+            self.shp_path,
+            np.array([_square_wkb(0, 0), _square_wkb(2, 0)], dtype=object),
+            [np.array(['ZW01', 'ZW02'], dtype=object), np.array(['Harare', ''], dtype=object)],
+            ['ADM1_PCODE', 'ADM1_EN'],
+            geometry_type='Polygon',
+            crs='EPSG:4326',
+        )
+
+    def test_reads_field_names_and_values_in_order(self):
+        field_names, features = _read_shapefile(self.shp_path)
+        features = list(features)
+
+        self.assertEqual(field_names, ['ADM1_PCODE', 'ADM1_EN'])
+        self.assertEqual([values for values, _ in features], [('ZW01', 'Harare'), ('ZW02', None)])
+
+    def test_polygons_are_promoted_to_multipolygons(self):
+        _, features = _read_shapefile(self.shp_path)
+        geometries = [geometry for _, geometry in features]
+
+        self.assertEqual([geometry.geom_type for geometry in geometries], ['MultiPolygon', 'MultiPolygon'])
+        self.assertEqual(geometries[0].area, 1.0)
+
+
+class TimestampAdminMixinTests(SimpleTestCase):
+    def setUp(self):
+        self.model_admin = ProvinceAdmin(Province, admin.site)
+        self.province = Province(
+            created_at=datetime(2024, 1, 2, 3, 4, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 5, 6, 7, 8, tzinfo=timezone.utc),
+        )
+
+    def _displayed(self, name):
+        _, _, value = lookup_field(name, self.province, self.model_admin)
+        return value
+
+    def test_changelist_and_readonly_fields_use_the_display_methods(self):
+        for name in (*self.model_admin.list_display, *self.model_admin.readonly_fields):
+            self.assertNotIn(name, ('created_at', 'updated_at'))
+
+    def test_database_formatted_annotation_is_displayed(self):
+        self.province._created_str = '2024-01-02 03:04 (db)'
+        self.province._updated_str = '2024-05-06 07:08 (db)'
+
+        self.assertEqual(self._displayed('created_at_display'), '2024-01-02 03:04 (db)')
+        self.assertEqual(self._displayed('updated_at_display'), '2024-05-06 07:08 (db)')
+
+    def test_falls_back_to_python_formatting_without_annotation(self):
+        self.assertEqual(self._displayed('created_at_display'), '2024-01-02 03:04')
@@ -1,5 +1,5 @@
 from django.contrib.auth.decorators import user_passes_test, login_required
-from django.http import JsonResponse, HttpResponseNotAllowed
+from django.http import HttpResponse, HttpResponseNotAllowed, HttpResponseNotModified, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET, require_POST, require_http_methods
 from django.core.serializers import serialize
@@ -7,19 +7,46 @@ from django.contrib.gis.db.models.functions import AsGeoJSON
 from django.views.decorators.cache import never_cache
 from django.contrib.gis.geos import GEOSGeometry
 from django.core.cache import cache
+from django.db import connection, connections
+from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
 from django.conf import settings
 from .models import Province, District, FirePoint
-import json
+import gzip
+import hashlib
+import re
+import orjson
 from datetime import datetime, timedelta
 import logging
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
+# Cached payloads change only on upload, so clients and CDNs may reuse them for this long
+PUBLIC_CACHE_CONTROL = 'public, max-age=3600, stale-while-revalidate=60'
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+# Streamed responses up to this size are also kept in the cache
+STREAM_CACHE_MAX_BYTES = 5 * 1024 * 1024
+STREAM_CHUNK_SIZE = 2000
+
 # =====================
 # DECORATORS & HELPERS
 # =====================
 
+def dump_json(data):
+    """Encode data with orjson, writing UTC datetimes with a Z suffix like Django's encoder"""
+    return orjson.dumps(data, option=orjson.OPT_UTC_Z)
+
+def json_response(data, status=200):
+    """HttpResponse carrying orjson-encoded data"""
+    return HttpResponse(dump_json(data), content_type='application/json', status=status)
+
+def _envelope_tail():
+    """Encoded closing members of a success envelope, starting after the 'data' value"""
+    return b',' + dump_json({'version': settings.API_VERSION})[1:]
+
 def api_response(format='json'):
     """Decorator to standardize API responses"""
     def decorator(view_func):
@@ -30,13 +57,13 @@ def api_response(format='json'):
                 
                 if format == 'json':
                     if isinstance(result, dict):
+                        # No timestamp: identical data encodes to identical bytes (stable ETags/caches)
                         response_data = {
                             'status': 'success',
                             'data': result,
-                            'timestamp': datetime.now().isoformat(),
                             'version': settings.API_VERSION
                         }
-                        response = JsonResponse(response_data)
+                        response = json_response(response_data)
                     else:
                         return result  # Assume it's already a response
                 
@@ -54,10 +81,113 @@ def api_response(format='json'):
                     'code': getattr(e, 'code', 500),
                     'timestamp': datetime.now().isoformat()
                 }
-                return JsonResponse(error_data, status=500)
+                return json_response(error_data, status=500)
         return wrapped_view
     return decorator
 
+def params_cache_key(prefix, params):
+    """Cache key for a set of query parameters that is the same in every worker process"""
+    key_src = '&'.join(f'{k}={v}' for k, v in sorted(params.items()))
+    return f'{prefix}_{hashlib.blake2b(key_src.encode(), digest_size=16).hexdigest()}'
+
+def encode_rows(queryset):
+    """Encode a values() queryset as a JSON array, aggregated by PostgreSQL when available"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return dump_json(list(queryset))
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT coalesce(json_agg(row_to_json(t)), '[]')::text FROM ({sql}) t", params
+        )
+        return cursor.fetchone()[0].encode()
+
+def cached_json_response(request, cache_key, timeout, build):
+    """Serve a success payload from cache as ready-made JSON bytes, building it on a miss
+
+    build returns the already-encoded JSON for the 'data' member. Responses carry an ETag
+    and public Cache-Control so clients and CDNs can revalidate instead of refetching, and
+    a gzipped copy is compressed once per build and served to clients that accept it.
+    """
+    cached = cache.get(cache_key) if not settings.DEBUG else None
+    if cached is None:
+        payload = b'{"status":"success","data":' + build() + _envelope_tail()
+        etag = quote_etag(hashlib.blake2b(payload, digest_size=16).hexdigest())
+        compressed = gzip.compress(payload, compresslevel=6)
+        cache.set(cache_key, (etag, payload, compressed), timeout=timeout)
+    else:
+        etag, payload, compressed = cached
+    
+    use_gzip = bool(ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+    if use_gzip:
+        etag = f'W/{etag}'  # same content, different bytes
+    
+    # Weak comparison, as GET revalidation allows
+    if_none_match = {tag.removeprefix('W/') for tag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))}
+    if etag.removeprefix('W/') in if_none_match or '*' in if_none_match:
+        response = HttpResponseNotModified()
+    elif use_gzip:
+        response = HttpResponse(compressed, content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(payload, content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = PUBLIC_CACHE_CONTROL
+    response['Vary'] = 'Accept-Encoding'
+    return response
+
+def _stream_rows(queryset):
+    """Yield the success envelope around a values() queryset, one encoded chunk of rows at a time"""
+    yield b'{"status":"success","data":['
+    rows = []
+    separator = b''
+    for row in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE):
+        rows.append(dump_json(row))
+        if len(rows) == STREAM_CHUNK_SIZE:
+            yield separator + b','.join(rows)
+            separator = b','
+            rows = []
+    if rows:
+        yield separator + b','.join(rows)
+    yield b']' + _envelope_tail()
+
+def streaming_json_response(cache_key, timeout, queryset):
+    """Stream a success payload without materializing the rows, caching it when it stays small"""
+    payload = cache.get(cache_key) if not settings.DEBUG else None
+    if payload is not None:
+        return HttpResponse(payload, content_type='application/json')
+    
+    def generate():
+        parts, size = [], 0
+        for chunk in _stream_rows(queryset):
+            if parts is not None:
+                parts.append(chunk)
+                size += len(chunk)
+                if size > STREAM_CACHE_MAX_BYTES:
+                    parts = None
+            yield chunk
+        if parts is not None:
+            cache.set(cache_key, b''.join(parts), timeout=timeout)
+    
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+def table_stats(recent_since):
+    """Row counts, latest timestamps and recent fire points for the data tables in one query"""
+    qn = connection.ops.quote_name
+    updated_at, acq_date = qn('updated_at'), qn('acq_date')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT 'provinces', COUNT(*), MAX({updated_at}), 0 FROM {qn(Province._meta.db_table)} "
+            f"UNION ALL SELECT 'districts', COUNT(*), MAX({updated_at}), 0 FROM {qn(District._meta.db_table)} "
+            f"UNION ALL SELECT 'firepoints', COUNT(*), MAX({acq_date}), "
+            f"COUNT(CASE WHEN {acq_date} >= %s THEN 1 END) FROM {qn(FirePoint._meta.db_table)}",
+            [recent_since]
+        )
+        return {
+            name: {'count': count, 'latest': latest.isoformat() if latest else None, 'recent': recent}
+            for name, count, latest, recent in cursor.fetchall()
+        }
+
 def is_superuser(user):
     """Check if user is authenticated superuser"""
     return user.is_authenticated and user.is_superuser
@@ -109,43 +239,28 @@ def home(request):
 # DATA ENDPOINTS
 # =====================
 
-@never_cache
 @require_GET
 @api_response()
 def provinces_json(request):
     """Endpoint for province GeoJSON data"""
-    cache_key = 'provinces_geojson'
-    cached_data = cache.get(cache_key)
-    
-    if cached_data and not settings.DEBUG:
-        return cached_data
-        
-    provinces = Province.objects.annotate(geojson=AsGeoJSON('geometry')).values(
-        'id', 'admin1Name', 'admin1Pcod', 'geojson'
-    )
+    def build():
+        return encode_rows(Province.objects.annotate(geojson=AsGeoJSON('geometry')).values(
+            'id', 'admin1Name', 'admin1Pcod', 'geojson'
+        ))
     
-    result = list(provinces)
-    cache.set(cache_key, result, timeout=3600)  # Cache for 1 hour
-    return result
+    # Cache the encoded bytes for 1 hour so hits skip both the query and serialization
+    return cached_json_response(request, 'provinces_geojson', 3600, build)
 
-@never_cache
 @require_GET
 @api_response()
 def districts_json(request):
     """Endpoint for district GeoJSON data"""
-    cache_key = f'districts_geojson_{request.GET.urlencode()}'
-    cached_data = cache.get(cache_key)
+    def build():
+        return encode_rows(District.objects.annotate(geojson=AsGeoJSON('geometry')).values(
+            'id', 'admin2Name', 'admin2Pcod', 'admin1Name', 'geojson'
+        ))
     
-    if cached_data and not settings.DEBUG:
-        return cached_data
-        
-    districts = District.objects.annotate(geojson=AsGeoJSON('geometry')).values(
-        'id', 'admin2Name', 'admin2Pcod', 'admin1Name', 'geojson'
-    )
-    
-    result = list(districts)
-    cache.set(cache_key, result, timeout=3600)
-    return result
+    return cached_json_response(request, params_cache_key('districts_geojson', request.GET.dict()), 3600, build)
 
 @never_cache
 @require_GET
@@ -153,13 +268,7 @@ def districts_json(request):
 def firepoints_json(request):
     """Endpoint for firepoint GeoJSON data with filtering"""
     # Generate cache key based on query parameters
-    params = request.GET.dict()
-    cache_key = f'firepoints_{hash(frozenset(params.items()))}'
-    
-    # Return cached response if available
-    cached_data = cache.get(cache_key)
-    if cached_data and not settings.DEBUG:
-        return cached_data
+    cache_key = params_cache_key('firepoints', request.GET.dict())
     
     # Build queryset
     firepoints = FirePoint.objects.annotate(geojson=AsGeoJSON('geometry'))
@@ -181,15 +290,14 @@ def firepoints_json(request):
         default_date = datetime.now() - timedelta(days=30)
         firepoints = firepoints.filter(acq_date__gte=default_date)
     
-    # Prepare response
-    result = list(firepoints.values(
+    # Stream rows in chunks instead of building the whole list in memory
+    firepoints = firepoints.values(
         'id', 'latitude', 'longitude', 'brightness',
         'acq_date', 'frp', 'confidence', 'geojson'
-    ).order_by('-acq_date'))
+    ).order_by('-acq_date')
     
     # Cache for 15 minutes (shorter TTL due to frequent updates)
-    cache.set(cache_key, result, timeout=900)
-    return result
+    return streaming_json_response(cache_key, 900, firepoints)
 
 # =====================
 # ADMIN ENDPOINTS
@@ -201,21 +309,20 @@ def firepoints_json(request):
 @api_response()
 def data_status(request):
     """Admin endpoint for data freshness check"""
+    stats = table_stats(timezone.now() - timedelta(days=1))
     return {
         'provinces': {
-            'count': Province.objects.count(),
-            'latest': Province.objects.latest('updated_at').updated_at.isoformat() if Province.objects.exists() else None
+            'count': stats['provinces']['count'],
+            'latest': stats['provinces']['latest']
         },
         'districts': {
-            'count': District.objects.count(),
-            'latest': District.objects.latest('updated_at').updated_at.isoformat() if District.objects.exists() else None
+            'count': stats['districts']['count'],
+            'latest': stats['districts']['latest']
         },
         'firepoints': {
-            'count': FirePoint.objects.count(),
-            'latest': FirePoint.objects.latest('acq_date').acq_date.isoformat() if FirePoint.objects.exists() else None,
-            'last_24h': FirePoint.objects.filter(
-                acq_date__gte=datetime.now()-timedelta(days=1)
-            ).count()
+            'count': stats['firepoints']['count'],
+            'latest': stats['firepoints']['latest'],
+            'last_24h': stats['firepoints']['recent']
         }
     }
 
@@ -223,30 +330,21 @@ def data_status(request):
 # NEW FEATURES
 # =====================
 
-@never_cache
 @require_GET
 @api_response()
 def data_overview(request):
     """Public statistics endpoint"""
-    cache_key = 'data_overview'
-    cached_data = cache.get(cache_key)
-    
-    if cached_data and not settings.DEBUG:
-        return cached_data
-    
-    stats = {
-        'province_count': Province.objects.count(),
-        'district_count': District.objects.count(),
-        'firepoint_count': FirePoint.objects.count(),
-        'latest_firepoint_date': FirePoint.objects.latest('acq_date').acq_date.isoformat() 
-            if FirePoint.objects.exists() else None,
-        'recent_firepoints': FirePoint.objects.filter(
-            acq_date__gte=datetime.now()-timedelta(days=7)
-        ).count()
-    }
+    def build():
+        table = table_stats(timezone.now() - timedelta(days=7))
+        return dump_json({
+            'province_count': table['provinces']['count'],
+            'district_count': table['districts']['count'],
+            'firepoint_count': table['firepoints']['count'],
+            'latest_firepoint_date': table['firepoints']['latest'],
+            'recent_firepoints': table['firepoints']['recent']
+        })
     
-    cache.set(cache_key, stats, timeout=3600)
-    return stats
+    return cached_json_response(request, 'data_overview', 3600, build)
 
 @never_cache
 @require_http_methods(["POST"])
@@ -256,7 +354,7 @@ def webhook_receiver(request):
     """Endpoint for receiving data update webhooks"""
     if request.method == 'POST':
         try:
-            payload = json.loads(request.body)
+            payload = orjson.loads(request.body)
             # Validate payload
             if payload.get('secret') != settings.WEBHOOK_SECRET:
                 raise PermissionError("Invalid webhook secret")
@@ -267,7 +365,7 @@ def webhook_receiver(request):
             
             return {'status': 'cache_cleared'}
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise ValueError("Invalid JSON payload")
         except Exception as e:
             logger.error(f"Webhook error: {str(e)}")